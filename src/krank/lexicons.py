@@ -3,14 +3,18 @@ Fetchers for Krank's Lexicons module.
 
 The Lexicons module fetches open-source lexicons (including LIWC dictionaries).
 """
+from functools import lru_cache
 from importlib.resources import files
-import inspect
 import json
-import re
+from pathlib import Path
 
-import pandas as pd
 import pooch
 
+try:  # orjson decodes a few times faster than stdlib json, if available
+    import orjson as _json
+except ImportError:
+    _json = json
+
 
 __all__ = [
     "fetch_honor",
@@ -23,11 +27,18 @@ __all__ = [
 # Private Utilities
 ################################################################################
 
+# Resolved once at import; pooch.os_cache does platform/env lookups.
+_LEXICONS_CACHE_DIR = pooch.os_cache("krank") / "lexicons"
+
+# Category ids that appear in the honor .dic file without a definition.
+_UNKNOWN_CATS = frozenset({"800", "999"})
+
+
+@lru_cache(maxsize=1)
 def _read_registry():
-    data_dir = files("krank.data")
-    with open(data_dir.joinpath("lexicons.json"), "rt", encoding="utf-8") as f:
-        registry = json.load(f)
-    return registry
+    # Parsed once per process; callers should treat the result as read-only.
+    text = files("krank.data").joinpath("lexicons.json").read_text(encoding="utf-8")
+    return _json.loads(text)
 
 
 def _retrieve_lexicon(name, version, **kwargs):
@@ -51,12 +62,14 @@ def _retrieve_lexicon(name, version, **kwargs):
         The full local filepath of the retrieved file.
     """
     registry = _read_registry()
+    versions = registry[name]
     if version is None:
-        version = sorted(registry[name])[-1]
+        version = sorted(versions)[-1]
+    entry = versions[version]
     kwargs.setdefault("fname", name)
-    kwargs.setdefault("path", pooch.os_cache("krank").joinpath("lexicons"))
-    kwargs.setdefault("url", registry[name][version]["url"])
-    kwargs.setdefault("known_hash", "md5:" + registry[name][version]["md5"])
+    kwargs.setdefault("path", _LEXICONS_CACHE_DIR)
+    kwargs.setdefault("url", entry["url"])
+    kwargs.setdefault("known_hash", "md5:" + entry["md5"])
     fp = pooch.retrieve(**kwargs)
     return fp
 
@@ -88,7 +101,7 @@ def _read_txt(fp, **kwargs):
 # Specific Lexicon Fetchers
 ################################################################################
 
-def fetch_honor(version=None, load=False, **kwargs):
+def fetch_honor(version=None, load=False, cache=True, **kwargs):
     """
     Fetch and read the Honor LIWC dictionary.
 
@@ -112,6 +125,10 @@ def fetch_honor(version=None, load=False, **kwargs):
         If ``True`` (default), fetch the file and load it as a :class:`~pandas.DataFrame`.
         If ``False``, fetch the file and return the local filepath.
         If a callable, fetch the file an load it with the custom callable.
+    cache : bool
+        If ``True`` (default), cache the parsed :class:`~pandas.DataFrame` as a
+        Parquet file next to the downloaded dictionary and reuse it on
+        subsequent calls (requires a parquet engine, e.g. :mod:`pyarrow`).
     **kwargs : dict, optional
         Additional keyword arguments are passed to :func:`pooch.retrieve`.
 
@@ -119,39 +136,71 @@ def fetch_honor(version=None, load=False, **kwargs):
     -------
     Filepath or DataFrame
     """
-    dataset = inspect.stack()[0][3].split("_")[-1]
+    name = "honor"
     fp = _retrieve_lexicon(name=name, version=version, **kwargs)
     if not load:
         return fp
     elif callable(load):
         return load(fp)
     ## Custom loader ##
-    data = _read_txt(fp)  # windows-1251/latin1
-    # data = data.replace("“Honor”", '"Honor"')
-    ## Fix tab-separation ##
-    # First remove any end-of-line tabs or spaces
-    data1 = re.sub(r"\s+$", r"\n", data, flags=re.MULTILINE).strip()
-    # Replace any tabs followed by additional spacing with a single tab
-    data2 = re.sub(r"\t\s+", r"\t", data1, flags=re.MULTILINE)
-    # This pattern is slightly different than the more generic one,
-    # because the file has lots of weird/inconsistent formatting.
-    categories = re.findall(r"^([0-9]+)\t(.*)$", data, flags=re.MULTILINE)
-    # categories = re.findall(r"^(\d+)\t(.*)$", data, flags=re.MULTILINE)
-    # categories = re.findall(r"^(\d+)\s+([^\t]+)$", data, flags=re.MULTILINE)
-    categories = {k: v.strip() for k, v in categories}
-    # words = re.findall(r"^([^\t%0-9]+)((?:\s+\d+)*)", data, flags=re.MULTILINE)
-    # words = re.findall(r"^([^\t\%0-9]+)((?:\s+\d+)*)", data, flags=re.MULTILINE)
-    # words = re.findall(r"^([a-zA-Z\*]+)((?:\s+\d+)*)", data, flags=re.MULTILINE)
-    words = re.findall(r"^([^\s\%0-9][^\t]+)((?:\s+\d+)*)", data, flags=re.MULTILINE)
-    words = {k: v.strip().split() for k, v in words}
-    unknown_category_ids = ["800", "999"]
-    words = {k: [categories[x] for x in v if x not in unknown_category_ids] for k, v in words.items()}
-    # words = {k: re.findall(r"\d+", a) for k, v in categories}
-    # dictionary = {catname: catkey for catkey, catname in categories.items()}
-    df = pd.DataFrame(data=False, index=list(words), columns=list(categories.values()), dtype=bool)
-    df = df.sort_index(axis=0).sort_index(axis=1)  # Speeding loop up?
-    for k, v in words.items():
-        df.loc[k, v] = True
+    # pandas/numpy are imported lazily so `import krank` stays cheap for
+    # filepath-only use.
+    import numpy as np
+    import pandas as pd
+
+    # Short-circuit to a parquet cache of the parsed frame, unless the
+    # .dic file was re-downloaded since the cache was written.
+    pq = Path(fp).with_suffix(".parquet")
+    if cache and pq.exists() and pq.stat().st_mtime >= Path(fp).stat().st_mtime:
+        return pd.read_parquet(pq)
+    # The format is line-oriented, so stream the file rather than slurping
+    # it into one big string and regex-scanning it. The checks are a bit
+    # defensive because the file has lots of weird/inconsistent formatting.
+    categories = {}
+    words = {}
+    with open(fp, "rt", encoding="utf-8") as f:  # windows-1251/latin1
+        for line in f:
+            line = line.rstrip()
+            if not line or line[0] == "%" or line[0].isspace():
+                continue
+            first, _, rest = line.partition("\t")
+            if first[0].isdigit():
+                # Category definition line ("<id>\t<name>").
+                if first.isdigit() and rest:
+                    categories[first] = rest.strip()
+                continue
+            # Word entry line ("<word>\t<ids...>"). Category definitions
+            # precede the words, so ids resolve to names inline.
+            words[first] = [
+                categories[x]
+                for x in rest.split()
+                if x.isdigit() and x not in _UNKNOWN_CATS
+            ]
+    # Build the word-by-category boolean membership matrix in one shot,
+    # rather than filling a False DataFrame with per-row .loc assignments.
+    word_names = sorted(words)
+    cat_names = sorted(categories.values())
+    cat_to_j = {c: j for j, c in enumerate(cat_names)}
+    # Preallocate the (row, col) coordinate arrays at their exact final
+    # size instead of growing Python lists pair by pair.
+    n_pairs = sum(map(len, words.values()))
+    rows = np.empty(n_pairs, dtype=np.int32)
+    cols = np.empty(n_pairs, dtype=np.int32)
+    k = 0
+    for i, word in enumerate(word_names):
+        cats = words[word]
+        n = len(cats)
+        rows[k : k + n] = i
+        cols[k : k + n] = [cat_to_j[c] for c in cats]
+        k += n
+    arr = np.zeros((len(word_names), len(cat_names)), dtype=bool)
+    arr[rows, cols] = True
+    df = pd.DataFrame(arr, index=word_names, columns=cat_names)
+    if cache:
+        try:
+            df.to_parquet(pq)
+        except ImportError:  # no parquet engine installed
+            pass
     return df
 
 
@@ -176,20 +225,22 @@ def fetch_threat(version=None, load=True, **kwargs):
     dictionary : dict
         A dictionary with abbreviated category names as keys and category words as values.
     """
-    dataset = inspect.stack()[0][3].split("_")[-1]
+    name = "threat"
     fp = _retrieve_lexicon(name=name, version=version, **kwargs)
     if not load:
         return fp
     elif callable(load):
         return load(fp)
     ## Custom loader ##
+    import numpy as np
+    import pandas as pd
+
     threat_ngrams = _read_txt(fp).splitlines()
-    df = (
-        pd.DataFrame({"Ngram": threat_ngrams, "threat": 1})
-        .astype({"Ngram": "string", "threat": "int64"})
-        .set_index("Ngram")
-        .rename_axis("Category", axis=1)
-        .sort_index(axis=0)
-        .sort_index(axis=1)
-    )
+    # Sort the raw n-grams once and build the frame directly on a named
+    # index, instead of astype/set_index/rename/sort chaining.
+    ngrams = np.sort(np.asarray(threat_ngrams, dtype=object))
+    df = pd.DataFrame(
+        {"threat": np.ones(ngrams.size, dtype=np.int8)},
+        index=pd.Index(ngrams, name="Ngram"),
+    ).rename_axis("Category", axis=1)
     return df
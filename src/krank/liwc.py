@@ -8,7 +8,7 @@ Fetch functions in the LIWC module differ slightly from others in that they
 are often dependent on the Tables module, since that's where I put some tables
 of LIWC scores that I extracted from publications.
 """
-import pandas as pd
+import re
 
 from . import tables
 
@@ -19,6 +19,17 @@ __all__ = [
 ]
 
 
+# Raw-to-long LIWC category fixes for Cariola 2010, compiled once at import
+# so per-call Series.replace does not recompile each pattern.
+_CARIOLA_RAW_TO_LONG = [
+    (re.compile(r"emotions$"), "emotion"),
+    (re.compile(r"clusion$"), "clusive"),
+    (re.compile(r"iveness$"), "ive"),
+    (re.compile(r"^Sight$"), "See"),
+    (re.compile(r"person singular pronouns$"), "pers singular"),
+]
+
+
 ################################################################################
 # Specific fetching functions
 ################################################################################
@@ -53,6 +64,8 @@ def fetch_barrett2020(version=None, load=True, target_dic=None, **kwargs):
         df = loader(fp)
         return df
     ## Custom processing ##
+    import pandas as pd
+
     return pd.read_table(fp)
 
 
@@ -126,33 +139,32 @@ def fetch_cariola2010(version=None, load=True, target_dic=None, **kwargs):
         df = loader(fp)
         return df
     ## Custom processing ##
+    import pandas as pd
+
     source_dic = "LIWC2007"
     read_kwargs = {"index_col": None, "usecols": ["Linguistic processes", "Mean", "SD"]}
     df = pd.read_table(fp, **read_kwargs)
     # Raw-to-long
     # Get all LIWC categories to be exact long-format names of the relevant dictionary
-    raw_to_long = {
-        r"emotions$": "emotion",
-        r"clusion$": "clusive",
-        r"iveness$": "ive",
-        r"^Sight$": "See",
-        r"person singular pronouns$": "pers singular",
-    }
-    df["Linguistic processes"] = df["Linguistic processes"].replace(raw_to_long, regex=True)
+    col = df["Linguistic processes"]
+    for pat, repl in _CARIOLA_RAW_TO_LONG:
+        col = col.str.replace(pat, repl, regex=True)
+    df["Linguistic processes"] = col
     # for k, v in raw_to_long.items():
     #     df.index = df.index.str.replace(k, v, regex=True)
-    # Long-to-short
-    # Convert all long-format LIWC category names to short-format (abbreviation) names
+    # Long-to-short (and optionally short-to-short)
+    # Convert all long-format LIWC category names to short-format (abbreviation) names.
+    # If a target dictionary is requested, compose the two mappings up front so
+    # the column is only walked once.
     long_to_short = utils.get_abbrev_mapping(source_dic)
-    df["Linguistic processes"] = df["Linguistic processes"].map(long_to_short)
-    # df.index = df.index.map(long_to_short)
-    # Short-to-short
-    # If desired, convert all short-format LIWC names to short-format LIWC names from a new dictionary
     if target_dic is not None:
         assert isinstance(target_dic, str), "`target_dic` must be a string or None"
         assert target_dic in liwc_dictionaries, f"{target_dic} is not one of the available dictionaries"
         source_to_target = get_liwc_catmap(source_dic, target_dic)
-        df["Linguistic processes"] = df["Linguistic processes"].map(source_to_target)
+        long_to_short = {k: source_to_target.get(v) for k, v in long_to_short.items()}
+    df["Linguistic processes"] = df["Linguistic processes"].map(long_to_short)
+    # df.index = df.index.map(long_to_short)
+    if target_dic is not None:
         df = df.dropna(subset=["Linguistic processes"])
         # Log the number that were dropped
     df = sanitize_dataframe(df)
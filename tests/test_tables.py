@@ -0,0 +1,31 @@
+"""Tests for the Tables module loaders."""
+import pandas as pd
+
+from krank.tables import _load_judges_table1
+
+
+def test_load_judges_table1_dimension_prefix(tmp_path):
+    # Minimal slice of the Pennebaker 1999/2001 Table 1 layout: dimension
+    # header rows carry a numeral prefix and an empty Abbrev.
+    fp = tmp_path / "pennebaker1999.table1"
+    fp.write_text(
+        "Dimension\tAbbrev\tExamples\t# Words\tJudge 1\tJudge 2\n"
+        "I. Standard linguistic dimensions\t\t\t\t\t\n"
+        "Pronouns\tPronoun\tI, them, itself\t70\t1.0\t1.0\n"
+        "Articles\tArticle\ta, an, the\t3\t1.0\t1.0\n"
+        "II. Psychological processes\t\t\t\t\t\n"
+        "Affective processes\tAffect\thappy, cried\t615\t0.91\t0.93\n",
+        encoding="utf-8",
+    )
+    df = _load_judges_table1(fp)
+    # The numeral prefix is stripped from every row, including on pandas
+    # versions where .str on a categorical mangles split output.
+    assert df["dimension"].tolist() == [
+        "Standard Linguistic Dimensions",
+        "Standard Linguistic Dimensions",
+        "Psychological Processes",
+    ]
+    assert df["category"].tolist() == ["Pronouns", "Articles", "Affective processes"]
+    assert list(df.columns) == ["dimension", "category", "abbrev", "examples", "n_words", "r1", "r2"]
+    assert df["n_words"].tolist() == [70.0, 3.0, 615.0]
+    assert isinstance(df["dimension"].dtype, pd.CategoricalDtype)